@@ -130,10 +130,11 @@ class CompanyListHandler:
         """Get list of unprocessed EU companies"""
         return [c for c in self.companies if c['name'] not in self.processed_companies]
     
-    def mark_company_as_processed(self, company_name):
-        """Mark a company as processed"""
+    def mark_company_as_processed(self, company_name, save=True):
+        """Mark a company as processed (pass save=False to batch the progress-file write)"""
         self.processed_companies.add(company_name)
-        self.save_progress()
+        if save:
+            self.save_progress()
     
     def load_progress(self):
         """Load progress from file"""
@@ -189,11 +190,35 @@ class CompanyListHandler:
     def is_document_downloaded(self, doc_id):
         """Check if a document has already been downloaded"""
         return doc_id in self.downloaded_docs
-        
+
+    def get_all_downloaded_ids(self):
+        """Get a snapshot of all downloaded document IDs"""
+        return set(self.downloaded_docs)
+
     def mark_document_as_downloaded(self, doc_id):
         """Mark a document as downloaded"""
         self.downloaded_docs.add(doc_id)
         self.save_downloaded_docs()
+
+    def mark_documents_as_downloaded_bulk(self, doc_ids):
+        """Mark several documents as downloaded with a single append to the tracking file.
+
+        Returns the IDs that were not already marked, in input order and without repeats.
+        """
+        new_ids = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id not in self.downloaded_docs]
+        if not new_ids:
+            return new_ids
+        self.downloaded_docs.update(new_ids)
+        try:
+            self.downloaded_docs_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.downloaded_docs_file, 'a') as f:
+                f.write(''.join(f"{doc_id}\n" for doc_id in new_ids))
+                f.flush()
+                os.fsync(f.fileno())
+            logger.info(f"Marked {len(new_ids)} documents as downloaded")
+        except Exception as e:
+            logger.error(f"Error saving downloaded documents: {str(e)}")
+        return new_ids
         
     def get_document_id(self, url, company_name, doc_type, date):
         """Generate a unique document ID based on URL, company name, doc type, and date"""
@@ -217,7 +242,7 @@ class CompanyListHandler:
         except FileNotFoundError:
             return set()
 
-    def add_document_stats(self, company_name, doc_type, date):
+    def add_document_stats(self, company_name, doc_type, date, save=True):
         """Add a downloaded document to the company stats"""
         if company_name not in self.company_stats:
             self.company_stats[company_name] = {
@@ -236,7 +261,8 @@ class CompanyListHandler:
         self.company_stats[company_name]["document_types"][doc_type] += 1
         
         # Save updated stats
-        self.save_company_stats()
+        if save:
+            self.save_company_stats()
         
     def get_document_hash(self, doc_info):
         """Generate a hash for a document to uniquely identify it"""
@@ -251,4 +277,23 @@ class CompanyListHandler:
         
         # Update company stats if details are provided
         if company_name and doc_type and date:
-            self.add_document_stats(company_name, doc_type, date) 
\ No newline at end of file
+            self.add_document_stats(company_name, doc_type, date)
+
+    def add_downloaded_documents_bulk(self, records):
+        """Add several (doc_hash, company_name, doc_type, date) records with one write per tracking file"""
+        records = list(records)
+        if not records:
+            return
+        new_ids = set(self.mark_documents_as_downloaded_bulk(doc_hash for doc_hash, _, _, _ in records))
+
+        # Only count documents that were newly added, once each
+        stats_updated = False
+        for doc_hash, company_name, doc_type, date in records:
+            if doc_hash not in new_ids:
+                continue
+            new_ids.discard(doc_hash)
+            if company_name and doc_type and date:
+                self.add_document_stats(company_name, doc_type, date, save=False)
+                stats_updated = True
+        if stats_updated:
+            self.save_company_stats()
@@ -41,15 +41,21 @@ Configuration:
 
 import os
 import sys
+import errno
 import time
 import json
 import logging
 import requests
 import random
 import hashlib
-from pathlib import Path
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -59,7 +65,7 @@ from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 from fuzzywuzzy import fuzz
 from .company_list_handler import CompanyListHandler
-from functools import wraps
+from functools import wraps, lru_cache
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
 import re
@@ -73,6 +79,86 @@ RESULTS_CONTAINER_ID = "resultsTable" # ID of the DIV containing the results tab
 RESULTS_TABLE_ID = "T01" # ID of the TABLE element itself (inside the container)
 COOKIE_ACCEPT_BUTTON_SELECTOR = "//button[contains(text(), 'Accept') or contains(text(), 'Agree')]" # Example XPath
 RESULTS_PER_PAGE_DROPDOWN_ID = "tablePageSize" # Corrected ID based on inspection
+RESULT_ROW_SELECTOR = "tbody tr" # CSS selector for result rows, relative to the results table
+NEXT_PAGE_LINK_TEXT = "Next" # Link text of the pagination control
+NO_RESULTS_SELECTOR = ".no-results, .empty-results" # Explicit 'No results' message
+PAGE_SIZE_RELOAD_TIMEOUT = 2 # Seconds to wait for more rows after enlarging the page size
+NEXT_PAGE_WAIT_TIMEOUT = 5 # Seconds to wait for the 'Next' link; it is rendered with the table, so a long wait only stalls the last page
+
+# Locators built once at import instead of on every call
+SEARCH_INPUT_LOCATOR = (By.ID, SEARCH_INPUT_ID)
+SEARCH_BUTTON_LOCATOR = (By.ID, SEARCH_BUTTON_ID)
+RESULTS_CONTAINER_LOCATOR = (By.ID, RESULTS_CONTAINER_ID)
+RESULTS_TABLE_LOCATOR = (By.ID, RESULTS_TABLE_ID)
+RESULT_ROWS_LOCATOR = (By.CSS_SELECTOR, f"#{RESULTS_CONTAINER_ID} {RESULT_ROW_SELECTOR}")
+RESULTS_FIRST_ROW_LOCATOR = RESULT_ROWS_LOCATOR # presence_of_element_located matches the first row
+RESULTS_PER_PAGE_DROPDOWN_LOCATOR = (By.ID, RESULTS_PER_PAGE_DROPDOWN_ID)
+NEXT_PAGE_LOCATOR = (By.LINK_TEXT, NEXT_PAGE_LINK_TEXT)
+NO_RESULTS_LOCATOR = (By.CSS_SELECTOR, NO_RESULTS_SELECTOR)
+COOKIE_ACCEPT_BUTTON_LOCATOR = (By.XPATH, COOKIE_ACCEPT_BUTTON_SELECTOR)
+
+# Chrome arguments applied to every browser spawn (headless is added separately)
+_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-notifications',
+    '--disable-popup-blocking',
+    '--disable-blink-features=AutomationControlled',
+    '--start-maximized', # May not work in headless
+    '--window-size=1920,1080', # Set a default window size
+)
+
+# Fonts and trackers the scraper never needs; blocked over CDP so pages finish loading sooner
+# (images are already switched off by the content-settings pref in setup_driver)
+_BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+# True once the DOM has been parsed and the element with id arguments[0] is present
+_PAGE_READY_SCRIPT = "return document.readyState !== 'loading' && document.getElementById(arguments[0]) !== null;"
+
+# Maps a result row to [cell texts (first span, else the cell), first link's
+# [href, last URL path segment, link text] or null]
+_ROW_VALUES_JS = (
+    "const rowValues = row => {"
+    "const cells = Array.from(row.querySelectorAll('td')).map(td => (td.querySelector('span') || td).innerText.trim());"
+    "const a = row.querySelector('td a') || row.querySelector('a');"
+    "const link = a ? [a.href, a.href ? new URL(a.href).pathname.split('/').pop() : '', a.innerText.trim()] : null;"
+    "return [cells, link];"
+    "};"
+)
+# Values of every visible row matching selector arguments[1] under element arguments[0] in one WebDriver call
+# (hidden rows are skipped, as the per-row visibility wait used to do)
+_TABLE_ROWS_SCRIPT = _ROW_VALUES_JS + (
+    "return Array.from(arguments[0].querySelectorAll(arguments[1]))"
+    ".filter(row => row.getClientRects().length > 0 && getComputedStyle(row).visibility !== 'hidden')"
+    ".map(rowValues);"
+)
+
+# Headers sent with every document download; PDFs are already compressed, so ask for them unencoded
+_DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'identity',
+}
+
+# File extensions accepted as-is for downloaded documents (compared lowercased)
+_DOC_EXTENSIONS = ('.pdf', '.docx', '.zip')
+
+# Precompiled patterns used when naming and organizing downloaded files
+_CONTENT_DISPOSITION_FILENAME_RE = re.compile('filename="?([^"]+)"?')
+_INVALID_PATH_CHARS_RE = re.compile(r'[\\\\/:*?\"<>|]')
+_NON_WORD_RE = re.compile(r'\W+')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+
+@lru_cache(maxsize=4096)
+def _sanitize_company_name(company_name: str) -> str:
+    """Return a directory-safe company name (cached: every file of a company shares it)."""
+    # Limit length first so the substitution only runs over the part that is kept (it is a 1:1 character swap)
+    # Replace invalid characters (e.g., /, \, :, *, ?, ", <, >, |) with underscores
+    return _INVALID_PATH_CHARS_RE.sub('_', company_name[:100])
 
 # --- Decorator Definition (Moved Outside Class) --- 
 def retry_on_failure(max_retries=3, base_delay=5, 
@@ -84,9 +170,15 @@ def retry_on_failure(max_retries=3, base_delay=5,
             last_exception = None
             for attempt in range(max_retries):
                 try:
-                    return func(self, *args, **kwargs)
+                    result = func(self, *args, **kwargs)
+                    if result and attempt == 0:
+                        self._clean_streak += 1
+                    else:
+                        self._clean_streak = 0 # Needed a retry or reported failure: restore full random delays
+                    return result
                 except retry_exceptions as e:
                     last_exception = e
+                    self._clean_streak = 0 # Site is struggling: restore full random delays
                     func_name = func.__name__
                     if attempt < max_retries - 1:
                         delay = base_delay * (2 ** attempt)  # Exponential backoff
@@ -142,7 +234,7 @@ def retry_on_failure(max_retries=3, base_delay=5,
 # --- End Decorator Definition ---
 
 class ESMAScraper:
-    def __init__(self, download_dir=None, debug_mode=True, headless=True):
+    def __init__(self, download_dir=None, debug_mode=True, headless=True, company_list_handler=None):
         """Initialize the ESMA scraper"""
         self.logger = logging.getLogger(__name__)
         
@@ -157,6 +249,7 @@ class ESMAScraper:
             
         # Create download directory if it doesn't exist
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs = {self.download_dir} # Directories known to exist, to skip repeat mkdir calls
         
         # Initialize document hashes database
         self.document_hashes_file = Path("data/document_hashes.json")
@@ -165,6 +258,7 @@ class ESMAScraper:
         
         # Initialize context for deduplication
         self.current_company = None
+        self._today_str = datetime.now().strftime('%Y%m%d') # Fallback date for file names, refreshed per company
         # self.current_doc_type = None # Potentially unused
         
         # Set debug mode
@@ -181,7 +275,8 @@ class ESMAScraper:
         self.headless = headless
         self.fuzzy_match_threshold = 80
         # self.min_similarity = 80 # Potentially unused, replaced by fuzzy_match_threshold?
-        self.company_list_handler = CompanyListHandler()
+        # Reuse the caller's handler when given, so the company Excel file is only parsed once per run
+        self.company_list_handler = company_list_handler or CompanyListHandler()
         
         # Session configuration
         self.session_start_time = time.time()
@@ -190,16 +285,29 @@ class ESMAScraper:
         self.max_requests_per_session = 100
         self.min_delay = 1
         self.max_delay = 3
+        self._clean_streak = 0 # Consecutive steps that succeeded first time for the current company; shortens random delays
         self.default_wait_timeout = 40 # Increased default wait timeout from 20
         self.download_wait_time = 60 # Increased default download wait time
         
+        # HTTP session for document downloads (keep-alive, carries browser cookies)
+        self.max_download_workers = 4 # Concurrent downloads per company; keep low to stay polite to ESMA
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_download_workers,
+            pool_maxsize=self.max_download_workers,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.http_session.mount('https://', adapter)
+        self.http_session.mount('http://', adapter)
+        self.http_session.headers.update(_DOWNLOAD_HEADERS)
+        # Serializes dedup, file organization and hash-database writes across download threads
+        self._download_lock = threading.Lock()
+        
         # Initialize driver
         self.driver = None
         self.wait = None # Initialize wait object here
+        self.cookies_handled = False # Set once the cookie banner has been dealt with in this browser session
         self.setup_driver()
-        
-        # Processed files hash tracker for deduplication
-        self.processed_files = set()
 
     def setup_driver(self):
         """Set up the Chrome driver with retries."""
@@ -218,16 +326,8 @@ class ESMAScraper:
                 else:
                     self.logger.info("Running in non-headless (headed) mode.")
 
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--disable-extensions')
-                # options.add_argument('--disable-infobars') # Deprecated
-                options.add_argument('--disable-notifications')
-                options.add_argument('--disable-popup-blocking')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_argument('--start-maximized') # May not work in headless
-                options.add_argument('--window-size=1920,1080') # Set a default window size
+                for arg in _CHROME_ARGS:
+                    options.add_argument(arg)
 
                 # User agent rotation (optional, example)
                 # user_agents = [...] # List of user agents
@@ -239,9 +339,13 @@ class ESMAScraper:
                     "download.prompt_for_download": False,
                     "download.directory_upgrade": True,
                     "safebrowsing.enabled": True,
-                    "plugins.always_open_pdf_externally": True # Try to force download PDFs
+                    "plugins.always_open_pdf_externally": True, # Try to force download PDFs
+                    "profile.managed_default_content_settings.images": 2 # Don't load images
                 }
                 options.add_experimental_option("prefs", prefs)
+
+                # Return from driver.get at DOMContentLoaded instead of waiting for every subresource
+                options.page_load_strategy = 'eager'
                 
                 # Initialize the undetected Chrome driver
                 self.logger.info(f"Initializing Chrome driver (Attempt {attempt + 1}/{max_retries})...")
@@ -252,9 +356,17 @@ class ESMAScraper:
                 # Set timeouts
                 self.driver.set_page_load_timeout(60) # Increased page load timeout
                 self.driver.set_script_timeout(30)
+
+                # Block fonts and trackers at the network layer (non-fatal if CDP is unavailable)
+                try:
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+                except Exception as e:
+                    self.logger.warning(f"Could not set blocked URLs via CDP: {e}")
                 
                 # Initialize WebDriverWait
                 self.wait = WebDriverWait(self.driver, self.default_wait_timeout) 
+                self.cookies_handled = False # A fresh browser profile shows the cookie banner again
                 
                 self.logger.info("Chrome driver initialized successfully")
                 return True
@@ -277,7 +389,13 @@ class ESMAScraper:
                     raise # Re-raise the last exception
 
     def close(self):
-        """Close the browser and clean up resources."""
+        """Close the browser and the download session."""
+        self._quit_driver()
+        if getattr(self, 'http_session', None):
+            self.http_session.close()
+
+    def _quit_driver(self):
+        """Quit the browser, leaving the download session's pooled connections open."""
         if hasattr(self, 'driver') and self.driver:
             try:
                 self.logger.info("Closing Chrome driver...")
@@ -289,6 +407,13 @@ class ESMAScraper:
                 self.driver = None
                 self.wait = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
     def __del__(self):
         """Ensure browser is closed when object is destroyed."""
         self.close()
@@ -320,12 +445,23 @@ class ESMAScraper:
         except Exception as e:
             self.logger.error(f"Error saving document hashes: {str(e)}", exc_info=True)
 
+    def _sync_session_cookies(self):
+        """Copy the browser's cookies into the HTTP download session."""
+        try:
+            for cookie in self.driver.get_cookies():
+                self.http_session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+            self.logger.debug(f"Synced {len(self.http_session.cookies)} browser cookies to download session.")
+        except Exception as e:
+            self.logger.warning(f"Could not sync browser cookies to download session: {e}")
+
     def random_delay(self, min_seconds=None, max_seconds=None):
         """Add a random delay. Uses instance defaults if not provided."""
         min_s = min_seconds if min_seconds is not None else self.min_delay
         max_s = max_seconds if max_seconds is not None else self.max_delay
-        delay = random.uniform(min_s, max_s)
-        self.logger.debug(f"Applying random delay: {delay:.2f} seconds")
+        # Shrink the delay by 5% per clean step of the current company (down to 10%); any retry or failed step resets it
+        factor = max(0.1, 1.0 - self._clean_streak * 0.05)
+        delay = random.uniform(min_s, max_s) * factor
+        self.logger.debug(f"Applying random delay: {delay:.2f} seconds (clean streak: {self._clean_streak})")
         time.sleep(delay)
 
     def check_session_health(self):
@@ -335,8 +471,10 @@ class ESMAScraper:
         
         if (session_duration > self.max_session_duration or 
             self.requests_count >= self.max_requests_per_session):
-            self.logger.info(f"Session limits reached (Duration: {session_duration:.0f}s, Requests: {self.requests_count}). Refreshing...")
-            self.refresh_session()
+            self.logger.info(f"Session limits reached (Duration: {session_duration:.0f}s, Requests: {self.requests_count}). Resetting browser state...")
+            # Start a fresh site session in the running browser; only restart Chrome if that fails
+            if not self.reset_browser_state():
+                self.refresh_session()
             return True # Indicate session was refreshed
         # Optional: Check if browser is still responsive
         try:
@@ -347,9 +485,25 @@ class ESMAScraper:
             return True
         return False
 
+    def reset_browser_state(self):
+        """Clear cookies and cache in the running browser instead of restarting it"""
+        try:
+            # CDP clears cookies for every origin; delete_all_cookies only covers the current document's domain
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            self.driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            self.http_session.cookies.clear()
+            self.cookies_handled = False # Cleared cookies bring the consent banner back
+            self.session_start_time = time.time()
+            self.requests_count = 0
+            self.logger.info("Browser state reset without restarting Chrome")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not reset browser state ({e}). Falling back to a full restart...")
+            return False
+
     def refresh_session(self):
         """Refresh the browser session"""
-        self.close() # Close existing driver first
+        self._quit_driver() # Close existing driver first; downloads keep their connection pool
         try:
             self.setup_driver() # Re-initialize driver and wait object
             self.session_start_time = time.time()
@@ -384,17 +538,22 @@ class ESMAScraper:
 
     @retry_on_failure() # Retry might be needed here too
     def set_results_per_page(self, num_results=100):
-        """Set the number of results per page in the search."""
+        """Set the number of results per page in the search.
+
+        Returns False when the page size could not be changed; the search can still
+        continue with the default page size.
+        """
         self.logger.info(f"Attempting to set results per page to {num_results}...")
         dropdown_id = RESULTS_PER_PAGE_DROPDOWN_ID # Use constant
         option_value = str(num_results)
         
         try:
-            # Wait for the dropdown to be present AND visible with a shorter timeout
-            short_wait = WebDriverWait(self.driver, 10) # Use shorter timeout for non-critical element
+            # Wait for the dropdown to be present AND visible with a shorter timeout, polling
+            # faster than the 0.5s default so it is picked up as soon as it renders
+            short_wait = WebDriverWait(self.driver, 10, poll_frequency=0.1) # Use shorter timeout for non-critical element
             self.logger.debug(f"Waiting for dropdown with ID '{dropdown_id}' to be present and visible...")
             dropdown_element = short_wait.until(
-                EC.visibility_of_element_located((By.ID, dropdown_id)), # Changed to visibility_of_element_located
+                EC.visibility_of_element_located(RESULTS_PER_PAGE_DROPDOWN_LOCATOR), # Changed to visibility_of_element_located
                 message=f"Dropdown element with ID '{dropdown_id}' not found or not visible."
             )
             self.logger.debug("Dropdown element found and visible.")
@@ -402,8 +561,7 @@ class ESMAScraper:
             # Scroll into view (optional but can help)
             try:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", dropdown_element)
-                self.logger.debug("Scrolled dropdown into view.")
-                time.sleep(0.5) # Brief pause after scroll
+                self.logger.debug("Scrolled dropdown into view.") # scrollIntoView is synchronous, no pause needed
             except Exception as scroll_err:
                 self.logger.warning(f"Could not scroll dropdown into view: {scroll_err}")
 
@@ -416,6 +574,12 @@ class ESMAScraper:
                 self.logger.info(f"Results per page already set to {num_results}.")
                 return True
 
+            # A page that isn't full already holds every result; changing the size would only reload it
+            old_row_count = len(self.driver.find_elements(*RESULT_ROWS_LOCATOR))
+            if current_value.isdigit() and old_row_count < int(current_value):
+                self.logger.info(f"All {old_row_count} results fit on one page. Keeping page size {current_value}.")
+                return True
+
             self.logger.debug(f"Selecting option with value '{option_value}'...")
             # Wait for the specific option to be present within the select element
             short_wait.until(
@@ -427,13 +591,19 @@ class ESMAScraper:
             select.select_by_value(option_value)
             self.logger.info(f"Selected '{option_value}' from dropdown '{dropdown_id}'.")
 
-            # Add a brief pause AFTER interaction for JS/AJAX to potentially trigger
-            self.random_delay(0.5, 1.0) 
+            # The page was full, so a larger page size shows more rows once the AJAX reload lands
+            if num_results > old_row_count:
+                try:
+                    WebDriverWait(self.driver, PAGE_SIZE_RELOAD_TIMEOUT, poll_frequency=0.1).until(
+                        lambda d: len(d.find_elements(*RESULT_ROWS_LOCATOR)) > old_row_count
+                    )
+                except TimeoutException:
+                    self.logger.info(f"Row count stayed at {old_row_count} after changing page size; there may be no further results.")
 
             # Verification: Wait for results container to be present again and contain data
             self.logger.debug("Waiting for results table content to reload...")
             short_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, f"#{RESULTS_CONTAINER_ID} tbody tr")),
+                EC.presence_of_element_located(RESULTS_FIRST_ROW_LOCATOR),
                 message=f"Results table content (first row) did not appear in {RESULTS_CONTAINER_ID} after setting page size."
             )
             self.logger.info(f"Successfully set results per page to {num_results}.")
@@ -446,14 +616,14 @@ class ESMAScraper:
                 self.take_screenshot(f"warning_set_results_{num_results}_{timestamp}.png")
                 self.save_page_source(f"warning_set_results_{num_results}_{timestamp}.html")
             self.logger.info("Continuing with default results per page.")
-            return True  # Continue with default results per page
+            return False  # Caller continues with default results per page
         except Exception as e:
             self.logger.error(f"Unexpected error setting results per page: {e}", exc_info=True)
             if self.debug_mode:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 self.take_screenshot(f"unexpected_error_set_results_{num_results}_{timestamp}.png")
                 self.save_page_source(f"unexpected_error_set_results_{num_results}_{timestamp}.html")
-            return True  # Continue with default results per page
+            return False  # Caller continues with default results per page
 
     @retry_on_failure() # Apply the defined decorator
     def search_company(self, company_name: str):
@@ -466,16 +636,12 @@ class ESMAScraper:
             # May need to re-apply settings like results per page if session was refreshed
             # self.set_results_per_page() 
 
-        search_input_locator = (By.ID, SEARCH_INPUT_ID) # Example ID
-        search_button_locator = (By.ID, SEARCH_BUTTON_ID) # Example ID
-        results_table_locator = (By.CSS_SELECTOR, RESULTS_CONTAINER_ID) # Example ID
-
         try:
             # 1. Find and clear the search input field
-            self.logger.debug(f"Waiting for search input field '{search_input_locator}'...")
+            self.logger.debug(f"Waiting for search input field '{SEARCH_INPUT_LOCATOR}'...")
             search_input = self.wait.until(
-                EC.element_to_be_clickable(search_input_locator),
-                message=f"Search input '{search_input_locator}' not clickable."
+                EC.element_to_be_clickable(SEARCH_INPUT_LOCATOR),
+                message=f"Search input '{SEARCH_INPUT_LOCATOR}' not clickable."
             )
             self.logger.debug("Search input found. Clearing and sending keys...")
             search_input.clear()
@@ -488,10 +654,10 @@ class ESMAScraper:
             self.random_delay(0.5, 1.5)
 
             # 2. Find and click the search button
-            self.logger.debug(f"Waiting for search button '{search_button_locator}'...")
+            self.logger.debug(f"Waiting for search button '{SEARCH_BUTTON_LOCATOR}'...")
             search_button = self.wait.until(
-                EC.element_to_be_clickable(search_button_locator),
-                message=f"Search button '{search_button_locator}' not clickable."
+                EC.element_to_be_clickable(SEARCH_BUTTON_LOCATOR),
+                message=f"Search button '{SEARCH_BUTTON_LOCATOR}' not clickable."
             )
             self.logger.debug("Search button found. Clicking...")
             search_button.click()
@@ -502,14 +668,13 @@ class ESMAScraper:
             self.logger.debug("Waiting for search results table content to load...")
             # Option A: Wait for the results table container (Original - timed out)
             # self.wait.until(
-            #     EC.presence_of_element_located(results_table_locator),
+            #     EC.presence_of_element_located(RESULTS_CONTAINER_LOCATOR),
             #     message="Results table did not appear after search."
             # )
             # Option B: Wait for the first row within the table body (More robust)
-            results_first_row_locator = (By.CSS_SELECTOR, f"#{RESULTS_CONTAINER_ID} tbody tr")
             self.wait.until(
-                EC.presence_of_element_located(results_first_row_locator),
-                message=f"Results table content (first row) using selector '{results_first_row_locator}' did not appear after search."
+                EC.presence_of_element_located(RESULTS_FIRST_ROW_LOCATOR),
+                message=f"Results table content (first row) using selector '{RESULTS_FIRST_ROW_LOCATOR}' did not appear after search."
             )
             self.logger.debug("Results table content (first row) detected.")
 
@@ -543,12 +708,6 @@ class ESMAScraper:
         page_num = 1
         processed_urls = set() # Track URLs processed in this run to avoid duplicates within pagination
         
-        # More targeted selectors
-        results_table_locator = (By.ID, RESULTS_TABLE_ID) # Use the actual table ID
-        results_container_locator = (By.ID, RESULTS_CONTAINER_ID) # Container ID
-        result_row_selector = "tbody tr" # Example CSS selector for result rows
-        next_page_link_text = "Next" # Example link text for pagination
-
         while True:
             self.logger.info(f"Processing page {page_num} for '{company_name}'...")
             self.random_delay(1, 2) # Delay between page loads
@@ -557,7 +716,7 @@ class ESMAScraper:
                 # First check if the container exists
                 self.logger.debug("Checking for results container...")
                 results_container = self.wait.until(
-                    EC.presence_of_element_located(results_container_locator),
+                    EC.presence_of_element_located(RESULTS_CONTAINER_LOCATOR),
                     message=f"Results container not found on page {page_num}."
                 )
                 
@@ -567,7 +726,7 @@ class ESMAScraper:
                     # Using a shorter timeout to quickly check for the table
                     short_wait = WebDriverWait(self.driver, 5)
                     results_table = short_wait.until(
-                        EC.presence_of_element_located(results_table_locator),
+                        EC.presence_of_element_located(RESULTS_TABLE_LOCATOR),
                         message=f"Results table not found within container on page {page_num}."
                     )
                     self.logger.debug("Results table found.")
@@ -576,17 +735,15 @@ class ESMAScraper:
                     self.logger.debug("Table element not found. Looking for rows directly in container...")
                     results_table = results_container
                     
-                # Try to find rows either in the results table or container
-                # Use find_elements to avoid error if no rows exist
-                result_rows = results_table.find_elements(By.CSS_SELECTOR, result_row_selector)
+                # Read every row in the results table or container (cells and download link) in one script call
+                rows_values = self.driver.execute_script(_TABLE_ROWS_SCRIPT, results_table, RESULT_ROW_SELECTOR)
                 
-                if not result_rows:
+                if not rows_values:
                     self.logger.info(f"No result rows found on page {page_num}. Assuming end of results or no matching results.")
                     # Try to check for an explicit "No results" message
                     try:
-                        no_results_selector = (By.CSS_SELECTOR, ".no-results, .empty-results")
                         no_results_element = short_wait.until(
-                            EC.presence_of_element_located(no_results_selector),
+                            EC.presence_of_element_located(NO_RESULTS_LOCATOR),
                             message="No 'No results' message found."
                         )
                         self.logger.info(f"Found 'No results' message: {no_results_element.text}")
@@ -597,59 +754,36 @@ class ESMAScraper:
                 
                 # Capture the state of the table before processing rows
                 table_html_before = results_table.get_attribute('outerHTML')
-                self.logger.info(f"Found {len(result_rows)} result rows on page {page_num}.")
+                self.logger.info(f"Found {len(rows_values)} result rows on page {page_num}.")
 
                 # --- Processing Rows --- 
-                for index, row in enumerate(result_rows):
-                    row_data = None
+                for index, (cells, link) in enumerate(rows_values):
                     try:
-                        # Extract details from the row
-                        row_data = self.get_document_details(row)
-                        if row_data and row_data.get('url'):
-                            doc_url = row_data['url']
-                            if doc_url not in processed_urls:
-                                processed_urls.add(doc_url)
-                                all_documents.append(row_data)
-                                self.logger.debug(f"Processed result {index+1} on page {page_num}: {row_data.get('issuer_name', '?')} - {row_data.get('doc_type', '?')}")
-                            else:
-                                self.logger.debug(f"Skipping duplicate URL on page {page_num}: {doc_url}")
-                        else:
-                            self.logger.warning(f"Row {index+1} on page {page_num} yielded no valid document data.")
-                    except StaleElementReferenceException:
-                        self.logger.warning(f"Row {index+1} on page {page_num} became stale during processing. Re-finding table and retrying page.")
-                        # Re-find the table and break inner loop to retry the page processing
-                        self.wait.until(EC.presence_of_element_located(results_table_locator), "Results table disappeared after stale element.")
-                        break # Break the inner row processing loop
-                    except (NoSuchElementException, TimeoutException) as e:
+                        row_data = self._document_details_from_values(cells, link)
+                    except Exception as e:
+                        # One malformed row must not abort the rest of the page
                         self.logger.error(f"Error processing row {index+1} on page {page_num}: {type(e).__name__} - {str(e)}")
                         if self.debug_mode:
                             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            # Try capturing screenshot relative to the row if possible, else full page
-                            try: row.screenshot(str(self.screenshots_dir / f"error_proc_row_{page_num}_{index+1}_{timestamp}.png"))
-                            except Exception: self.take_screenshot(f"error_proc_row_{page_num}_{index+1}_{timestamp}.png")
-                            # Saving page source might be more useful here
                             self.save_page_source(f"error_proc_row_{page_num}_{index+1}_{timestamp}.html")
                         continue # Skip to the next row
-                    except Exception as e:
-                         self.logger.error(f"Unexpected error processing row {index+1} on page {page_num}: {e}", exc_info=True)
-                         if self.debug_mode:
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            try:
-                                result_element.screenshot(str(self.screenshots_dir / f"unexpected_error_proc_row_{page_num}_{index+1}_{timestamp}.png"))
-                            except Exception:
-                                self.take_screenshot(f"unexpected_error_proc_row_{page_num}_{index+1}_{timestamp}.png")
-                         continue # Skip to the next row
+                    if row_data.get('url'):
+                        doc_url = row_data['url']
+                        if doc_url not in processed_urls:
+                            processed_urls.add(doc_url)
+                            all_documents.append(row_data)
+                            self.logger.debug(f"Processed result {index+1} on page {page_num}: {row_data.get('issuer_name', '?')} - {row_data.get('doc_type', '?')}")
+                        else:
+                            self.logger.debug(f"Skipping duplicate URL on page {page_num}: {doc_url}")
                     else:
-                        # This 'else' block executes if the 'for' loop completed without a 'break'
-                        # Proceed to check for pagination
-                        pass
+                        self.logger.warning(f"Row {index+1} on page {page_num} yielded no valid document data.")
                
                 # --- Pagination --- 
                 try:
                     self.logger.debug("Checking for 'Next' page link...")
-                    # Wait for the 'Next' link to be potentially clickable
-                    next_button = self.wait.until(
-                        EC.element_to_be_clickable((By.LINK_TEXT, next_page_link_text)),
+                    # Wait briefly for the 'Next' link to be clickable; on the last page it never appears
+                    next_button = WebDriverWait(self.driver, NEXT_PAGE_WAIT_TIMEOUT).until(
+                        EC.element_to_be_clickable(NEXT_PAGE_LOCATOR),
                         message="'Next' page link not found or not clickable."
                     )
                     self.logger.info(f"Found 'Next' page link. Clicking page {page_num + 1}...")
@@ -658,7 +792,7 @@ class ESMAScraper:
                     # self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
                     # time.sleep(0.5) # Small pause before click
 
-                    next_button.click()
+                    self._click_element(next_button)
                     self.requests_count += 1
                     page_num += 1
 
@@ -671,7 +805,7 @@ class ESMAScraper:
                     except TimeoutException:
                         # Fallback: Check if the table HTML has changed significantly
                         self.logger.warning("Old table did not become stale. Checking for HTML change...")
-                        current_table_html = self.driver.find_element(*results_table_locator).get_attribute('outerHTML')
+                        current_table_html = self.driver.find_element(*RESULTS_TABLE_LOCATOR).get_attribute('outerHTML')
                         if current_table_html == table_html_before:
                             self.logger.error("Pagination clicked, but results table content did not change significantly.")
                             # Consider breaking or further investigation
@@ -679,31 +813,12 @@ class ESMAScraper:
                         else:
                             self.logger.debug("Results table HTML has changed.")
                     # Wait for the *new* results table to be present (redundant if staleness worked, but safe)
-                    self.wait.until(EC.presence_of_element_located(results_table_locator), "New results table did not appear after pagination.")
+                    self.wait.until(EC.presence_of_element_located(RESULTS_TABLE_LOCATOR), "New results table did not appear after pagination.")
 
                 except (TimeoutException, NoSuchElementException):
                     # If 'Next' link is not found or clickable, assume it's the last page
                     self.logger.info("No 'Next' page link found or clickable. Assuming end of results.")
                     break # Exit the pagination loop
-                except ElementClickInterceptedException:
-                    self.logger.warning("Clicking 'Next' button intercepted. Trying JavaScript click...")
-                    try:
-                        # Attempt JavaScript click as fallback
-                        next_button_js = self.driver.find_element(By.LINK_TEXT, next_page_link_text)
-                        self.driver.execute_script("arguments[0].click();", next_button_js)
-                        self.requests_count += 1
-                        page_num += 1
-                        # Add wait for staleness/reload as above
-                        self.logger.debug("Waiting for results table to update after JS pagination click...")
-                        WebDriverWait(self.driver, self.default_wait_timeout).until(EC.staleness_of(results_table))
-                        self.wait.until(EC.presence_of_element_located(results_table_locator))
-                    except Exception as js_e:
-                        self.logger.error(f"JavaScript click also failed for 'Next' button: {js_e}")
-                        if self.debug_mode:
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            self.take_screenshot(f"error_pagination_click_{page_num}_{timestamp}.png")
-                            self.save_page_source(f"error_pagination_click_{page_num}_{timestamp}.html")
-                        break # Exit loop if JS click fails
             except StaleElementReferenceException:
                      self.logger.warning(f"'Next' button became stale on page {page_num}. Retrying page processing.")
                      # The loop will naturally retry finding the button after re-finding the table
@@ -734,27 +849,101 @@ class ESMAScraper:
         self.logger.info(f"Finished processing results for '{company_name}'. Found {len(all_documents)} relevant documents across {page_num} page(s).")
         return all_documents
 
+    def search_and_process(self, company_name: str, company_info: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """Search ESMA for a company, download any new documents and return their details.
+
+        Returns None when the search page or the search itself failed, so callers can tell
+        a failed search apart from a company with no new documents.
+        """
+        self.logger.info(f"Starting search and processing for company: {company_name}")
+        self.current_company = company_name
+        self._today_str = datetime.now().strftime('%Y%m%d')
+        self._clean_streak = 0 # Every company starts at full politeness delays
+        downloaded_documents = []
+
+        if not self.navigate_to_search():
+            self.logger.error(f"Could not reach the search page for '{company_name}'.")
+            return None
+        if not self.search_company(company_name):
+            self.logger.error(f"Search failed for '{company_name}'.")
+            return None
+        self.set_results_per_page(100)
+
+        documents = self.process_results(company_name)
+        self._sync_session_cookies()
+        # Snapshot the downloaded IDs once so each link is an in-memory lookup
+        downloaded_ids = self.company_list_handler.get_all_downloaded_ids()
+
+        pending = []
+        for doc in documents:
+            doc_id = self.company_list_handler.get_document_id(doc['url'], company_name, doc.get('doc_type'), doc.get('date'))
+            if doc_id in downloaded_ids:
+                self.logger.debug(f"Skipping already downloaded document: {doc['url']}")
+                continue
+            downloaded_ids.add(doc_id) # Also drops repeats within this result set
+            pending.append((doc, doc_id))
+
+        try:
+            jobs = [(doc['url'], doc_id, doc.get('doc_type'), doc.get('date')) for doc, doc_id in pending]
+            for (doc, doc_id), file_path in zip(pending, self.download_documents(jobs)):
+                if file_path:
+                    downloaded_documents.append({**doc, 'doc_id': doc_id, 'file_path': file_path})
+        finally:
+            # Persist all marks and stats for this company in one write per tracking file
+            self.company_list_handler.add_downloaded_documents_bulk(
+                (d['doc_id'], company_name, d.get('doc_type'), d.get('date')) for d in downloaded_documents
+            )
+
+        self.logger.info(f"Downloaded {len(downloaded_documents)} new documents for '{company_name}'.")
+        return downloaded_documents
+
+    def download_documents(self, jobs: List[Tuple[str, str, Optional[str], Optional[str]]]) -> List[Optional[str]]:
+        """Download (url, doc_id, doc_type_hint, date_hint) jobs concurrently; returns file paths in job order (None on failure)."""
+        results = [None] * len(jobs)
+        if not jobs:
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.max_download_workers, len(jobs))) as executor:
+            futures = {
+                executor.submit(self.download_document, url, doc_id, doc_type_hint=doc_type_hint, date_hint=date_hint): index
+                for index, (url, doc_id, doc_type_hint, date_hint) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def _click_element(self, element):
+        """Click an element, falling back to a JavaScript click if the native click is intercepted."""
+        try:
+            element.click()
+        except ElementClickInterceptedException:
+            self.logger.warning("Click intercepted. Trying JavaScript click...")
+            self.driver.execute_script("arguments[0].click();", element)
+
     def accept_cookies(self):
         """Attempt to find and click the cookie acceptance button."""
+        # Once the banner has been accepted in this browser session, skip the wait on every later navigation
+        if self.cookies_handled:
+            return True
         self.logger.debug("Checking for cookie acceptance button...")
         # Use a more flexible XPath that handles common variations
-        cookie_button_locator = (By.XPATH, COOKIE_ACCEPT_BUTTON_SELECTOR)
         try:
             # Use a shorter wait time for non-critical elements like cookie banners
-            short_wait = WebDriverWait(self.driver, 5) 
+            short_wait = WebDriverWait(self.driver, 2) 
             cookie_button = short_wait.until(
-                EC.element_to_be_clickable(cookie_button_locator),
-                message="Cookie button not found or not clickable within 5s."
+                EC.element_to_be_clickable(COOKIE_ACCEPT_BUTTON_LOCATOR),
+                message="Cookie button not found or not clickable within 2s."
             )
             self.logger.info("Cookie acceptance button found. Clicking...")
             cookie_button.click()
+            self.cookies_handled = True # Only a successful click settles the banner for this session
             # Wait briefly for banner to disappear (optional)
             WebDriverWait(self.driver, 3).until(
-                EC.invisibility_of_element_located(cookie_button_locator)
+                EC.invisibility_of_element_located(COOKIE_ACCEPT_BUTTON_LOCATOR)
             )
             self.logger.info("Clicked cookie acceptance button.")
             return True
         except TimeoutException:
+            # With the 'eager' page load strategy the banner can appear late, so check again on the next navigation
             self.logger.debug("Cookie acceptance button not found or did not disappear after click.")
             return False # Not necessarily an error, banner might not be present
         except (NoSuchElementException, ElementClickInterceptedException, ElementNotInteractableException) as e:
@@ -773,133 +962,35 @@ class ESMAScraper:
                 self.save_page_source(f"unexpected_error_cookie_{timestamp}.html")
             return False # Indicate failure
 
-    def get_document_details(self, result_element) -> Optional[Dict]:
-        """Extract document details from a single result row element."""
-        # Use relative searches within the result_element for robustness
+    def _document_details_from_values(self, cells: List[str], link: Optional[List[str]]) -> Dict:
+        """Build a document details dict from a row's cell texts and [href, filename, link text] values."""
         details = {'issuer_name': '', 'doc_type': '', 'date': '', 'url': '', 'filename': ''}
-        try:
-            # Wait briefly for the row to be fully rendered before extracting
-            WebDriverWait(self.driver, 2).until(EC.visibility_of(result_element)) 
-
-            # First, try to get all td elements in the row
-            try:
-                cells = result_element.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 3:  # Assume at least 3 cells are needed
-                    # Try to extract text from cells using different strategies
-                    try:
-                        # First cell should be issuer name
-                        span = cells[0].find_elements(By.TAG_NAME, "span")
-                        if span:
-                            details['issuer_name'] = span[0].text.strip()
-                        else:
-                            details['issuer_name'] = cells[0].text.strip()
-                    except (NoSuchElementException, IndexError) as e:
-                        self.logger.warning(f"Could not extract issuer name: {e}")
-                        details['issuer_name'] = "Unknown Issuer"
-                        
-                    try:
-                        # Second cell should be document type
-                        span = cells[1].find_elements(By.TAG_NAME, "span")
-                        if span:
-                            details['doc_type'] = span[0].text.strip()
-                        else:
-                            details['doc_type'] = cells[1].text.strip()
-                    except (NoSuchElementException, IndexError) as e:
-                        self.logger.warning(f"Could not extract document type: {e}")
-                        details['doc_type'] = "Unknown Type"
-                        
-                    try:
-                        # Third cell should be date
-                        span = cells[2].find_elements(By.TAG_NAME, "span")
-                        if span:
-                            details['date'] = span[0].text.strip()
-                        else:
-                            details['date'] = cells[2].text.strip()
-                    except (NoSuchElementException, IndexError) as e:
-                        self.logger.warning(f"Could not extract date: {e}")
-                        details['date'] = datetime.now().strftime("%Y-%m-%d")
-                        
-                    # Last cell should contain the download link
-                    try:
-                        # Try to find any link in any of the cells
-                        for cell in cells:
-                            links = cell.find_elements(By.TAG_NAME, "a")
-                            if links:
-                                download_link = links[0]
-                                details['url'] = download_link.get_attribute('href')
-                                # Extract filename from URL or link text if possible
-                                parsed_url = urlparse(details['url'])
-                                if parsed_url.path:
-                                    details['filename'] = Path(parsed_url.path).name
-                                else:
-                                    details['filename'] = download_link.text.strip() # Fallback to link text
-                                break
-                    except (NoSuchElementException, IndexError) as e:
-                        self.logger.warning(f"Could not find download link in cells: {e}")
-                else:
-                    self.logger.warning(f"Row doesn't have enough cells. Found: {len(cells)}")
-            except NoSuchElementException as e:
-                self.logger.warning(f"Could not find td elements in row: {e}")
-
-            # If we couldn't get the URL from cells, try a direct approach
-            if not details.get('url'):
-                try:
-                    # Try to find any link in the row
-                    links = result_element.find_elements(By.TAG_NAME, "a")
-                    if links:
-                        download_link = links[0]
-                        details['url'] = download_link.get_attribute('href')
-                        # Extract filename from URL if possible
-                        parsed_url = urlparse(details['url'])
-                        if parsed_url.path:
-                            details['filename'] = Path(parsed_url.path).name
-                        else:
-                            details['filename'] = download_link.text.strip() # Fallback to link text
-                except NoSuchElementException:
-                    self.logger.warning("Could not find any links in row.")
-           
-            # Check if essential details were found
-            if not details.get('url'):
-                self.logger.error("Failed to extract document URL from result row. Cannot download.")
-                # Capture state if critical info is missing
-                if self.debug_mode:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    try: result_element.screenshot(str(self.screenshots_dir / f"error_extract_url_{timestamp}.png"))
-                    except Exception: self.take_screenshot(f"error_extract_url_{timestamp}.png")
-                    self.save_page_source(f"error_extract_url_{timestamp}.html")
-                return None
-           
-            self.logger.debug(f"Extracted details: {details}")
-            return details
+        if len(cells) >= 3:  # Assume at least 3 cells are needed
+            # Issuer name, document type and date are the first three cells
+            details['issuer_name'], details['doc_type'], details['date'] = cells[:3]
+        else:
+            self.logger.warning(f"Row doesn't have enough cells. Found: {len(cells)}")
 
-        except StaleElementReferenceException:
-            self.logger.warning("Result row became stale while extracting details.")
-            # Indicate failure to the caller (process_results) which should handle retrying the page/table
-            raise # Re-raise for process_results to catch
-        except Exception as e:
-            self.logger.error(f"Unexpected error extracting details from row: {e}", exc_info=True)
-            # Capture state on unexpected error
-            if self.debug_mode:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                try: result_element.screenshot(str(self.screenshots_dir / f"unexpected_error_extract_{timestamp}.png"))
-                except Exception: self.take_screenshot(f"unexpected_error_extract_{timestamp}.png")
-                self.save_page_source(f"unexpected_error_extract_{timestamp}.html")
-            return None # Return None on unexpected error
+        # Use the first link in the cells, falling back to any link in the row
+        if link:
+            url, filename_part, link_text = link
+            details['url'], details['filename'] = url, filename_part or link_text
+        return details
 
     def get_file_hash(self, file_path: Path) -> Optional[str]:
         """Calculate SHA-256 hash of a file."""
         if not file_path or not file_path.is_file():
             self.logger.warning(f"Cannot hash non-existent file: {file_path}")
             return None
-        hasher = hashlib.sha256()
         try:
             with open(file_path, 'rb') as file:
-                while True:
-                    chunk = file.read(4096)  # Read in chunks
-                    if not chunk:
-                        break
+                if hasattr(hashlib, 'file_digest'):
+                    # file_digest (Python 3.11+) runs the read/update loop in C with large buffers
+                    return hashlib.file_digest(file, 'sha256').hexdigest()
+                hasher = hashlib.sha256()
+                for chunk in iter(lambda: file.read(1 << 20), b''):
                     hasher.update(chunk)
-            return hasher.hexdigest()
+                return hasher.hexdigest()
         except Exception as e:
             self.logger.error(f"Error calculating hash for {file_path}: {e}", exc_info=True)
             return None
@@ -907,18 +998,13 @@ class ESMAScraper:
     def download_document(self, url: str, doc_id: str = None, doc_type_hint: Optional[str] = None, date_hint: Optional[str] = None) -> Optional[str]:
         """Downloads a document using requests, checks for duplicates, and organizes it."""
         self.logger.info(f"Attempting to download document: {doc_id or url}")
-        self.requests_count += 1 # Increment request count for session management
+        with self._download_lock:
+            self.requests_count += 1 # Increment request count for session management (downloads run on worker threads)
 
         # --- Direct Download Attempt using Requests --- 
         try:
-            # Use requests for potentially faster/more reliable downloads than browser clicks
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                # Add other headers if needed (e.g., Referer, Cookies from Selenium session)
-                # 'Referer': self.driver.current_url,
-                # 'Cookie': '; '.join([f"{c['name']}={c['value']}" for c in self.driver.get_cookies()])
-            }
-            response = requests.get(url, headers=headers, stream=True, timeout=60) # Increased timeout
+            # Use the shared session: browser cookies are synced in and connections are reused
+            response = self.http_session.get(url, stream=True, timeout=(10, 60)) # (connect, read)
             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
 
             # --- Filename Determination --- 
@@ -926,7 +1012,7 @@ class ESMAScraper:
             filename = None
             if content_disposition:
                 # Try to parse filename from Content-Disposition header
-                filename_match = re.findall('filename="?([^"]+)"?', content_disposition)
+                filename_match = _CONTENT_DISPOSITION_FILENAME_RE.findall(content_disposition)
                 if filename_match:
                     filename = filename_match[0]
            
@@ -934,7 +1020,7 @@ class ESMAScraper:
             if not filename:
                  parsed_url = urlparse(url)
                  if parsed_url.path:
-                     filename = Path(parsed_url.path).name
+                     filename = PurePosixPath(parsed_url.path).name # URL paths are always '/'-separated
            
             # Generate a default filename if still missing
             if not filename:
@@ -943,18 +1029,19 @@ class ESMAScraper:
                 filename = f"esma_doc_{base_name}.pdf" # Ensure .pdf extension
            
             # Ensure filename has a .pdf extension (or other expected document extension)
-            if not re.search(r'\.(pdf|docx|zip)$', filename, re.IGNORECASE):
+            if not filename.lower().endswith(_DOC_EXTENSIONS):
                  filename += ".pdf"
 
-            # Define temporary download path
-            temp_download_path = self.download_dir / f"{filename}.part"
+            # Define temporary download path (unique so concurrent downloads never share a file)
+            temp_download_path = self.download_dir / f"{filename}.{uuid.uuid4().hex[:8]}.part"
 
             # --- Download Content --- 
             self.logger.debug(f"Downloading to temporary file: {temp_download_path}")
             hasher = hashlib.sha256()
             try:
                 with open(temp_download_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    # 1 MiB chunks are larger than the file buffer, so BufferedWriter hands them straight to the OS
+                    for chunk in response.iter_content(chunk_size=1 << 20):
                         if chunk: # filter out keep-alive new chunks
                             f.write(chunk)
                             hasher.update(chunk)
@@ -970,52 +1057,53 @@ class ESMAScraper:
             content_hash = hasher.hexdigest()
             self.logger.debug(f"Calculated hash for downloaded content: {content_hash}")
 
-            # --- Deduplication Check --- 
-            if content_hash in self.document_hashes:
-                existing_path = self.document_hashes[content_hash]
-                self.logger.info(f"Duplicate document detected (Hash: {content_hash}). Already exists at: {existing_path}")
-                # Clean up the temporary downloaded file
-                if temp_download_path.exists():
-                    temp_download_path.unlink()
-                    self.logger.debug(f"Removed temporary duplicate file: {temp_download_path}")
-                # Return the path of the existing file
-                # Check if the existing file still exists before returning path
-                if Path(existing_path).exists():
-                    return str(Path(existing_path))
-                else:
-                    self.logger.warning(f"Duplicate hash found, but existing file {existing_path} is missing. Proceeding to save new download.")
-                    # Remove the broken entry from hashes
-                    del self.document_hashes[content_hash]
-                    # Continue to organize and save the new file
-
-            # --- File Organization --- 
-            self.logger.debug("Organizing downloaded file...")
-            # Use self.current_company if set (e.g., called from main loop), otherwise use a placeholder
-            org_company_name = self.current_company if self.current_company else "UnknownCompany"
-            organized_successfully, final_path = self.organize_file(
-                temp_download_path, 
-                org_company_name, 
-                doc_type_hint=doc_type_hint, # Use passed hint
-                date_hint=date_hint,       # Use passed hint
-                content_hash=content_hash
-            )
+            with self._download_lock:
+                # --- Deduplication Check --- 
+                if content_hash in self.document_hashes:
+                    existing_path = self.document_hashes[content_hash]
+                    self.logger.info(f"Duplicate document detected (Hash: {content_hash}). Already exists at: {existing_path}")
+                    # Clean up the temporary downloaded file
+                    if temp_download_path.exists():
+                        temp_download_path.unlink()
+                        self.logger.debug(f"Removed temporary duplicate file: {temp_download_path}")
+                    # Return the path of the existing file
+                    # Check if the existing file still exists before returning path
+                    if Path(existing_path).exists():
+                        return str(Path(existing_path))
+                    else:
+                        self.logger.warning(f"Duplicate hash found, but existing file {existing_path} is missing. Proceeding to save new download.")
+                        # Remove the broken entry from hashes
+                        del self.document_hashes[content_hash]
+                        # Continue to organize and save the new file
+
+                # --- File Organization --- 
+                self.logger.debug("Organizing downloaded file...")
+                # Use self.current_company if set (e.g., called from main loop), otherwise use a placeholder
+                org_company_name = self.current_company if self.current_company else "UnknownCompany"
+                organized_successfully, final_path = self.organize_file(
+                    temp_download_path, 
+                    org_company_name, 
+                    doc_type_hint=doc_type_hint, # Use passed hint
+                    date_hint=date_hint,       # Use passed hint
+                    content_hash=content_hash
+                )
 
-            if organized_successfully and final_path:
-                self.logger.info(f"Document downloaded and organized successfully: {final_path}")
-                # Update hashes database
-                self.document_hashes[content_hash] = str(final_path)
-                self._save_document_hashes()
-                return str(final_path)
-            else:
-                self.logger.error(f"Failed to organize downloaded file from URL: {url}")
-                # Keep the temporary file for inspection if organization fails? No, delete.
-                if temp_download_path.exists():
-                     try:
-                         temp_download_path.unlink()
-                         self.logger.debug(f"Removed temporary file after organization failure: {temp_download_path}")
-                     except OSError as e:
-                          self.logger.error(f"Error removing temporary file {temp_download_path}: {e}")
-                return None
+                if organized_successfully and final_path:
+                    self.logger.info(f"Document downloaded and organized successfully: {final_path}")
+                    # Update hashes database
+                    self.document_hashes[content_hash] = str(final_path)
+                    self._save_document_hashes()
+                    return str(final_path)
+                else:
+                    self.logger.error(f"Failed to organize downloaded file from URL: {url}")
+                    # Keep the temporary file for inspection if organization fails? No, delete.
+                    if temp_download_path.exists():
+                         try:
+                             temp_download_path.unlink()
+                             self.logger.debug(f"Removed temporary file after organization failure: {temp_download_path}")
+                         except OSError as e:
+                              self.logger.error(f"Error removing temporary file {temp_download_path}: {e}")
+                    return None
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"HTTP error downloading {url}: {e}", exc_info=False) # Don't need full trace for HTTP errors
@@ -1038,16 +1126,12 @@ class ESMAScraper:
              return False, None
 
         # Sanitize company name for directory creation
-        # Replace invalid characters (e.g., /, \, :, *, ?, ", <, >, |) with underscores
-        sanitized_company_name = re.sub(r'[\\\\/:*?\"<>|]', '_', company_name)
-        # Limit length if necessary
-        sanitized_company_name = sanitized_company_name[:100] # Example limit
+        sanitized_company_name = _sanitize_company_name(company_name)
         
         # Create company-specific directory
         company_dir = self.download_dir / sanitized_company_name
         try:
-            company_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Ensured company directory exists: {company_dir}")
+            self._ensure_dir(company_dir)
         except OSError as e:
             self.logger.error(f"Failed to create company directory {company_dir}: {e}")
             return False, None
@@ -1055,14 +1139,14 @@ class ESMAScraper:
         # Determine Document Type
         doc_type = doc_type_hint or "UnknownType"
         # Basic sanitization for filename part
-        sanitized_doc_type = re.sub(r'\W+', '_', doc_type).strip('_')[:30]
+        sanitized_doc_type = _NON_WORD_RE.sub('_', doc_type).strip('_')[:30]
 
         # Determine Date
-        date_str = date_hint or datetime.now().strftime('%Y%m%d')
+        date_str = date_hint or self._today_str
         # Basic sanitization/formatting for filename part
-        sanitized_date = re.sub(r'[^0-9]', '', date_str)[:8]
+        sanitized_date = _NON_DIGIT_RE.sub('', date_str)[:8]
         if not sanitized_date:
-            sanitized_date = datetime.now().strftime('%Y%m%d')
+            sanitized_date = self._today_str
 
         # Get Content Hash (calculate if not provided)
         if not content_hash:
@@ -1096,7 +1180,7 @@ class ESMAScraper:
                     return False, None
             else:
                 # Move the temporary file to the final destination
-                shutil.move(str(temp_file_path), str(final_path))
+                self._move_file(temp_file_path, final_path)
                 self.logger.info(f"Successfully moved {temp_file_path.name} to {final_path}")
                 return True, final_path
         except Exception as e:
@@ -1107,24 +1191,44 @@ class ESMAScraper:
                 except OSError as del_e: self.logger.error(f"Error removing temp file {temp_file_path} after move error: {del_e}")
             return False, None
 
+    def _ensure_dir(self, directory: Path):
+        """Create a directory once per run; later calls for the same path skip the mkdir syscall."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+            self.logger.debug(f"Ensured directory exists: {directory}")
+
+    def _move_file(self, source: Path, destination: Path):
+        """Move a file with a single rename, copying only when source and destination are on different filesystems."""
+        try:
+            os.replace(source, destination)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        self.logger.debug(f"{source} and {destination} are on different filesystems. Copying instead of renaming.")
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            shutil.copyfileobj(src, dst, length=1 << 20)
+            if hasattr(os, 'posix_fadvise'):
+                # Both files are read only once; don't let the copy crowd out the page cache
+                os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.unlink(source)
+
     def wait_for_page_load(self, timeout=None):
         """Wait for the page to reach a ready state."""
         wait_time = timeout if timeout is not None else self.default_wait_timeout
         self.logger.debug(f"Waiting up to {wait_time}s for page ready state...")
         start_time = time.time()
         try:
-            # Wait for document.readyState to be 'complete'
+            # Wait for the DOM to be parsed and for the search input field (the key element that indicates
+            # the search page is loaded) in one predicate, so each poll is a single round-trip
+            self.logger.debug(f"Waiting for ready state and key element: #{SEARCH_INPUT_ID}")
             WebDriverWait(self.driver, wait_time).until(
-                lambda driver: driver.execute_script('return document.readyState') == 'complete'
+                lambda driver: driver.execute_script(_PAGE_READY_SCRIPT, SEARCH_INPUT_ID)
             )
             
-            # Additionally, wait for a key element that indicates search page is loaded
-            # Example: Wait for the search form container or search button to be present
-            # Adjust selector as needed
-            key_element_selector = (By.ID, SEARCH_INPUT_ID) # Use the search input field ID as indicator
-            self.logger.debug(f"Waiting for key element: {key_element_selector}")
-            WebDriverWait(self.driver, wait_time).until(EC.presence_of_element_located(key_element_selector))
-            
             self.logger.debug(f"Page reached ready state in {time.time() - start_time:.2f}s.")
             return True
         except TimeoutException:
@@ -1180,8 +1284,8 @@ if __name__ == "__main__":
             # --- Test Search and Processing --- 
             test_company = "BNP Paribas" # Choose a company with known results
             if scraper.search_company(test_company):
-                # Now set results per page AFTER search (since dropdown only appears after search)
-                time.sleep(4)  # Wait for dropdown to appear (up to 4 seconds as user indicated)
+                # Now set results per page AFTER search (since dropdown only appears after search);
+                # set_results_per_page waits for the dropdown itself
                 scraper.set_results_per_page(100)  # Set to 100 results per page
                 
                 # Process results
@@ -46,34 +46,44 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from processes.esma_scraper import ESMAScraper
 from processes.company_list_handler import CompanyListHandler
 
-# Configure colored logging
-handler = colorlog.StreamHandler()
-handler.setFormatter(colorlog.ColoredFormatter(
-    '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'red,bg_white',
-    }
-))
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/workflow.log'),
-        handler
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
+# Number of processed companies between progress-file writes
+PROGRESS_SAVE_INTERVAL = 10
+
+def configure_logging():
+    """Attach the colored console and workflow file handlers to the root logger once"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    # Colored console output
+    console_handler = colorlog.StreamHandler()
+    console_handler.setFormatter(colorlog.ColoredFormatter(
+        '%(log_color)s%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }
+    ))
+
+    # Plain-text workflow log
+    Path('logs').mkdir(exist_ok=True)
+    file_handler = logging.FileHandler('logs/workflow.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    root.addHandler(console_handler)
+    root.addHandler(file_handler)
+    root.setLevel(logging.INFO)
+
 def main():
     """Main function to run the ESMA document processing pipeline"""
+    configure_logging()
+
     # Parse arguments
     parser = argparse.ArgumentParser(description="ESMA document processing pipeline")
     parser.add_argument("--companies-file", default=os.path.join("data", "raw", "urgewald GOGEL 2023 V1.2.xlsx"), 
@@ -88,14 +98,15 @@ def main():
     try:
         logger.info("Starting ESMA document processing pipeline")
         
-        # Initialize scraper and company list handler
-        scraper = ESMAScraper()
+        # Initialize company list handler and scraper (sharing the handler so the Excel file is parsed once)
         company_handler = CompanyListHandler(args.companies_file)
+        scraper = ESMAScraper(company_list_handler=company_handler)
         
         try:
             # Get all unprocessed companies
             companies = company_handler.get_unprocessed_companies()
             logger.info(f"Found {len(companies)} European companies to process")
+            unsaved_progress = 0
             
             # Process each company
             for company in companies:
@@ -104,6 +115,10 @@ def main():
                 
                 try:
                     results = scraper.search_and_process(company_name, company_info=company)
+                    if results is None:
+                        # Leave the company unprocessed so the next run searches it again
+                        logger.warning(f"Search failed for {company_name}; it will be retried on the next run")
+                        continue
                     
                     if results:
                         logger.info(f"Found {len(results)} documents for {company_name}")
@@ -118,10 +133,12 @@ def main():
                     else:
                         logger.warning(f"No documents found for {company_name}")
                     
-                    # Mark company as processed
-                    company_handler.mark_company_as_processed(company_name)
-                    # Save progress after each company
-                    company_handler.save_progress()
+                    # Mark company as processed, saving progress in batches rather than after every company
+                    company_handler.mark_company_as_processed(company_name, save=False)
+                    unsaved_progress += 1
+                    if unsaved_progress >= PROGRESS_SAVE_INTERVAL:
+                        company_handler.save_progress()
+                        unsaved_progress = 0
                     
                 except Exception as e:
                     logger.error(f"Error processing {company_name}: {str(e)}")
@@ -133,6 +150,9 @@ def main():
             logger.error(f"Error processing companies: {str(e)}")
             if 'scraper' in locals() and scraper:
                 scraper.close()
+        finally:
+            # Persist any progress not yet written by the batched saves
+            company_handler.save_progress()
         
     except Exception as e:
         logger.error(f"Error in main: {str(e)}")
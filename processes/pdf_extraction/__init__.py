@@ -4,12 +4,17 @@ PDF Extraction Package
 A modular package for extracting information from PDF documents.
 """
 
-from .core import ExtractionEngine
-from .extractors.bank_extractor import BankExtractor
-from .extractors.date_extractor import DateExtractor
-from .extractors.currency_extractor import CurrencyExtractor
-from .extractors.coupon_extractor import CouponExtractor
-from .utils.text_processing import TextProcessor
+from importlib import import_module
+
+# Public name -> submodule defining it; imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    'ExtractionEngine': '.core',
+    'BankExtractor': '.extractors.bank_extractor',
+    'DateExtractor': '.extractors.date_extractor',
+    'CurrencyExtractor': '.extractors.currency_extractor',
+    'CouponExtractor': '.extractors.coupon_extractor',
+    'TextProcessor': '.utils.text_processing',
+}
 
 __all__ = [
     'ExtractionEngine',
@@ -18,4 +23,15 @@ __all__ = [
     'CurrencyExtractor',
     'CouponExtractor',
     'TextProcessor'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import a public class from its submodule the first time it is accessed"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -14,8 +14,8 @@ import pytesseract
 from PIL import Image
 import io
 from pathlib import Path
-from pdf2image import convert_from_path
-import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from .extractors.bank_extractor import BankExtractor
 from .extractors.date_extractor import DateExtractor
@@ -23,6 +23,12 @@ from .extractors.currency_extractor import CurrencyExtractor
 from .extractors.coupon_extractor import CouponExtractor
 from .utils.text_processing import TextProcessor
 
+# Resolution pages are rendered at for OCR (pdf2image's default, which OCR previously used)
+_OCR_DPI = 200
+
+# Filename terms that identify a prospectus / final terms document, matched in one pass
+_RECOGNIZED_FILENAME_RE = re.compile(r'prospectus|final|terms|offering|pricing')
+
 class ExtractionEngine:
     """Orchestrates the PDF extraction process."""
     
@@ -71,9 +77,7 @@ class ExtractionEngine:
         try:
             # Try PyMuPDF first
             with fitz.open(pdf_path) as doc:
-                text = ""
-                for page in doc:
-                    text += page.get_text()
+                text = "".join(page.get_text() for page in doc)
                     
                 # If text is too sparse, try pymupdf4llm for more intensive extraction
                 if len(text) < 100 * doc.page_count:
@@ -113,15 +117,24 @@ class ExtractionEngine:
         try:
             self.logger.info(f"Using OCR for {pdf_path}")
             
-            # Convert PDF to images
-            with tempfile.TemporaryDirectory() as temp_dir:
-                images = convert_from_path(pdf_path)
-                
-                # Process each page with OCR
-                text = ""
-                for i, image in enumerate(images):
-                    # Apply OCR to the image
-                    text += pytesseract.image_to_string(image)
+            # Render pages one at a time with PyMuPDF rather than all at once through Poppler
+            with fitz.open(pdf_path) as doc:
+                # Process each page with OCR; every page runs in its own tesseract
+                # subprocess, so threads are enough to keep several cores busy
+                if self.max_workers > 1 and doc.page_count > 1:
+                    workers = min(self.max_workers, doc.page_count)
+                    pages_text = []
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        # Keep at most `workers` rendered pages in flight to bound memory
+                        pending = deque()
+                        for image in self._render_pages(doc):
+                            if len(pending) >= workers:
+                                pages_text.append(pending.popleft().result())
+                            pending.append(executor.submit(pytesseract.image_to_string, image))
+                        pages_text.extend(future.result() for future in pending)
+                    text = "".join(pages_text)
+                else:
+                    text = "".join(pytesseract.image_to_string(image) for image in self._render_pages(doc))
                     
                 # Clean the extracted text
                 return self.text_processor.clean_text(text)
@@ -131,6 +144,20 @@ class ExtractionEngine:
             
         return ""
     
+    def _render_pages(self, doc: fitz.Document):
+        """
+        Render each page of an open PDF to an RGB image for OCR.
+        
+        Args:
+            doc: An open PyMuPDF document
+            
+        Yields:
+            One PIL image per page, in page order
+        """
+        for page in doc:
+            pix = page.get_pixmap(dpi=_OCR_DPI)
+            yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    
     def process_text(self, text: str, pdf_path: str) -> Dict[str, Any]:
         """
         Process extracted text to identify all required information.
@@ -224,7 +251,7 @@ class ExtractionEngine:
             
         # Check if the filename suggests this is a prospectus/final terms
         filename = os.path.basename(pdf_path).lower()
-        if not any(term in filename for term in ['prospectus', 'final', 'terms', 'offering', 'pricing']):
+        if not _RECOGNIZED_FILENAME_RE.search(filename):
             flags.append('filename_not_recognized')
             
         return flags
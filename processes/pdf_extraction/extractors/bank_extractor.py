@@ -4,6 +4,21 @@ from ..utils.pattern_registry import PatternRegistry
 from ..utils.text_processing import TextProcessor
 from .base_extractor import BaseExtractor
 
+# Context lines around a role that are clearly not bank names
+_NON_BANK_LINE_RE = re.compile(r'\b(?:Notes|Securities|Bonds|Issuer|Issue|Maturity|Coupon|Rate|if|and|or|the|dated|will)\b', re.IGNORECASE)
+# Capitalized runs that could be bank names
+_POTENTIAL_BANK_RE = re.compile(r'\b[A-Z][a-zA-Z\s&\']+(?:\([^)]+\))?\b')
+# Capitalized document terms that are never bank names
+_NON_BANK_TERM_RE = re.compile(r'\b(?:Page|Terms|Size|Amount|Total|Date|Final|Interest|Reference|Rate)\b')
+# Company suffixes and leading qualifiers stripped by clean_bank_name
+_BANK_SUFFIX_RE = re.compile(r'\s+(?:AG|plc|ltd|limited|inc|incorporated|llc|gmbh|sa|corp|corporation|group|s\.?[ap]\.?|n\.?v\.?|[&,]?\s+co(?:mpany)?)\.?$', re.IGNORECASE)
+_BANK_PREFIX_RE = re.compile(r'^(?:the|by)\s+', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Shapes of likely bank names checked by is_valid_bank_name
+_BANK_ENDING_RE = re.compile(r'(?:bank|capital|securities|asset|credit|invest|partners|financial|markets)$')
+_MULTI_WORD_NAME_RE = re.compile(r'^[A-Z][a-z]+(?:\s+(?:of|and|&)\s+[A-Z][a-z]+)+$')
+_PROPER_NAME_RE = re.compile(r'^[A-Z][a-zA-Z\s&\']+$')
+
 class BankExtractor(BaseExtractor):
     """Extracts bank names and roles from text."""
     
@@ -72,6 +87,7 @@ class BankExtractor(BaseExtractor):
             
             # Find bank roles in the section
             bank_roles = self._find_bank_roles(section_text)
+            section_lower = section_text.lower() if bank_roles else None
             
             # Find banks in the section
             extracted_banks = self._extract_banks(section_text)
@@ -80,22 +96,24 @@ class BankExtractor(BaseExtractor):
             for bank in extracted_banks:
                 cleaned_bank = self.clean_bank_name(bank)
                 if cleaned_bank and self.is_valid_bank_name(cleaned_bank):
-                    if cleaned_bank not in result['bank_info']:
-                        result['bank_info'][cleaned_bank] = {
-                            'roles': [],
-                            'sections': []
-                        }
+                    bank_entry = result['bank_info'].setdefault(cleaned_bank, {
+                        'roles': [],
+                        'sections': []
+                    })
                     
                     # Add section to bank info
-                    if section_name not in result['bank_info'][cleaned_bank]['sections']:
-                        result['bank_info'][cleaned_bank]['sections'].append(section_name)
+                    if section_name not in bank_entry['sections']:
+                        bank_entry['sections'].append(section_name)
                     
-                    # Try to associate with roles
-                    for role in bank_roles:
-                        role_text = self._get_text_around(section_text, bank, 100)
-                        if role in role_text.lower():
-                            if role not in result['bank_info'][cleaned_bank]['roles']:
-                                result['bank_info'][cleaned_bank]['roles'].append(role)
+                    # Try to associate with roles (the text around the bank is the same for every role)
+                    if bank_roles:
+                        role_text = self._get_text_around(section_text, bank, 100, text_lower=section_lower).lower()
+                        bank_entry_roles = bank_entry['roles']
+                        known_roles = set(bank_entry_roles)
+                        for role in bank_roles:
+                            if role in role_text and role not in known_roles:
+                                bank_entry_roles.append(role)
+                                known_roles.add(role)
                     
                     # Add to extracted banks list if not already there
                     if cleaned_bank not in result['extracted_banks']:
@@ -113,14 +131,15 @@ class BankExtractor(BaseExtractor):
         Returns:
             List of bank roles found
         """
-        roles = []
+        # dict keeps first-seen order with O(1) duplicate checks
+        roles = {}
         for pattern in self.patterns['bank_roles']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 role = match.group(0).lower().strip()
-                if role and role not in roles:
-                    roles.append(role)
-        return roles
+                if role:
+                    roles[role] = None
+        return list(roles)
     
     def _extract_banks(self, text: str) -> List[str]:
         """
@@ -136,7 +155,7 @@ class BankExtractor(BaseExtractor):
         
         # Look for common bank names
         for pattern in self.patterns['common_banks']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 bank = match.group(0)
                 if bank and bank not in banks:
@@ -144,7 +163,7 @@ class BankExtractor(BaseExtractor):
         
         # Look for potential banks near role indicators
         for role_pattern in self.patterns['bank_roles']:
-            matches = re.finditer(role_pattern, text, re.IGNORECASE)
+            matches = role_pattern.finditer(text)
             for match in matches:
                 role_pos = match.start()
                 
@@ -158,14 +177,14 @@ class BankExtractor(BaseExtractor):
                         continue
                         
                     # Skip lines that are clearly not bank names
-                    if re.search(r'\b(?:Notes|Securities|Bonds|Issuer|Issue|Maturity|Coupon|Rate|if|and|or|the|dated|will)\b', line, re.IGNORECASE):
+                    if _NON_BANK_LINE_RE.search(line):
                         continue
                         
                     # Look for capitalized words that could be bank names
-                    potential_banks = re.findall(r'\b[A-Z][a-zA-Z\s&\']+(?:\([^)]+\))?\b', line)
+                    potential_banks = _POTENTIAL_BANK_RE.findall(line)
                     for bank in potential_banks:
                         # Skip common non-bank terms
-                        if re.search(r'\b(?:Page|Terms|Size|Amount|Total|Date|Final|Interest|Reference|Rate)\b', bank):
+                        if _NON_BANK_TERM_RE.search(bank):
                             continue
                             
                         if bank and bank not in banks:
@@ -173,7 +192,7 @@ class BankExtractor(BaseExtractor):
         
         return banks
     
-    def _get_text_around(self, text: str, target: str, window: int = 50) -> str:
+    def _get_text_around(self, text: str, target: str, window: int = 50, text_lower: Optional[str] = None) -> str:
         """
         Get text around a target string.
         
@@ -181,6 +200,7 @@ class BankExtractor(BaseExtractor):
             text: The text to search in
             target: The target string to find
             window: Number of characters to include before and after
+            text_lower: Precomputed text.lower(), for callers searching the same text repeatedly
             
         Returns:
             Text around the target
@@ -189,7 +209,8 @@ class BankExtractor(BaseExtractor):
             return ""
             
         # Find the target in the text
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         target_lower = target.lower()
         
         start_idx = text_lower.find(target_lower)
@@ -216,13 +237,13 @@ class BankExtractor(BaseExtractor):
             return ""
             
         # Remove common suffixes and qualifiers
-        cleaned = re.sub(r'\s+(?:AG|plc|ltd|limited|inc|incorporated|llc|gmbh|sa|corp|corporation|group|s\.?[ap]\.?|n\.?v\.?|[&,]?\s+co(?:mpany)?)\.?$', '', bank, flags=re.IGNORECASE)
+        cleaned = _BANK_SUFFIX_RE.sub('', bank)
         
         # Remove common prefixes
-        cleaned = re.sub(r'^(?:the|by)\s+', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _BANK_PREFIX_RE.sub('', cleaned)
         
         # Normalize spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         
         # Standard name replacements
         replacements = {
@@ -280,17 +301,17 @@ class BankExtractor(BaseExtractor):
                 
         # Check against common bank patterns for higher confidence
         for pattern in self.patterns['common_banks']:
-            if re.search(pattern, bank, re.IGNORECASE):
+            if pattern.search(bank):
                 return True
                 
         # Additional checks for likely bank names
         # Common bank endings
-        if re.search(r'(?:bank|capital|securities|asset|credit|invest|partners|financial|markets)$', bank_lower):
+        if _BANK_ENDING_RE.search(bank_lower):
             return True
             
         # Has multiple capitalized words (like "Bank of America")
-        if re.search(r'^[A-Z][a-z]+(?:\s+(?:of|and|&)\s+[A-Z][a-z]+)+$', bank):
+        if _MULTI_WORD_NAME_RE.search(bank):
             return True
             
         # Default to accepting strings that look like proper names
-        return re.search(r'^[A-Z][a-zA-Z\s&\']+$', bank) is not None 
\ No newline at end of file
+        return _PROPER_NAME_RE.search(bank) is not None 
\ No newline at end of file
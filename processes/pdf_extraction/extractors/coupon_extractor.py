@@ -3,6 +3,13 @@ from typing import Dict, Any, Optional
 from ..utils.pattern_registry import PatternRegistry
 from .base_extractor import BaseExtractor
 
+# Percentage spellings and number formats normalized before matching
+_PER_CENT_RE = re.compile(r'per\s*cent\.?')
+_PERCENT_RE = re.compile(r'percent')
+_SPACE_BEFORE_PERCENT_RE = re.compile(r'\s+%')
+_DECIMAL_COMMA_RE = re.compile(r'(\d+),(\d+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class CouponExtractor(BaseExtractor):
     """Extracts coupon rate and type information."""
     
@@ -58,7 +65,7 @@ class CouponExtractor(BaseExtractor):
         # Find coupon rate
         coupon_rate = None
         for pattern in self.patterns['coupon_rate']:
-            matches = re.finditer(pattern, normalized_text, re.IGNORECASE)
+            matches = pattern.finditer(normalized_text)
             for match in matches:
                 rate_str = match.group(1)
                 try:
@@ -75,14 +82,12 @@ class CouponExtractor(BaseExtractor):
         # Find coupon type
         coupon_type = None
         for pattern in self.patterns['coupon_types']:
-            if re.search(pattern, normalized_text, re.IGNORECASE):
-                # Extract the matching type
-                match = re.search(pattern, normalized_text, re.IGNORECASE)
-                if match:
-                    coupon_type = match.group(0).strip().lower()
-                    # Standardize type format
-                    coupon_type = re.sub(r'\s+', ' ', coupon_type)
-                    break
+            match = pattern.search(normalized_text)
+            if match:
+                coupon_type = match.group(0).strip().lower()
+                # Standardize type format
+                coupon_type = _WHITESPACE_RE.sub(' ', coupon_type)
+                break
         
         # If we found a rate but no type, assume it's fixed rate
         if coupon_rate and not coupon_type:
@@ -105,13 +110,13 @@ class CouponExtractor(BaseExtractor):
             Normalized text
         """
         # Replace variations in percentage notation
-        normalized = re.sub(r'per\s*cent\.?', '%', text)
-        normalized = re.sub(r'percent', '%', normalized)
+        normalized = _PER_CENT_RE.sub('%', text)
+        normalized = _PERCENT_RE.sub('%', normalized)
         
         # Standardize spacing around percentage symbol
-        normalized = re.sub(r'\s+%', '%', normalized)
+        normalized = _SPACE_BEFORE_PERCENT_RE.sub('%', normalized)
         
         # Replace decimal separators if needed
-        normalized = re.sub(r'(\d+),(\d+)', r'\1.\2', normalized)
+        normalized = _DECIMAL_COMMA_RE.sub(r'\1.\2', normalized)
         
         return normalized 
\ No newline at end of file
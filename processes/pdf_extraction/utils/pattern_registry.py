@@ -1,3 +1,11 @@
+import re
+
+
+def _compile_patterns(patterns, flags=re.IGNORECASE):
+    """Compile every pattern in a {name: [pattern, ...]} mapping."""
+    return {name: [re.compile(pattern, flags) for pattern in group] for name, group in patterns.items()}
+
+
 class PatternRegistry:
     """Central repository for regex patterns used in extraction."""
     
@@ -34,8 +42,8 @@ class PatternRegistry:
     
     @staticmethod
     def get_bank_patterns():
-        """Get patterns for bank extraction."""
-        return {
+        """Get patterns for bank extraction (precompiled, case-insensitive)."""
+        return _compile_patterns({
             'bank_roles': [
                 r'(?:joint\s+)?(?:lead\s+)?(?:book[\-\s]?runner|manager|arranger|dealer|coordinator)',
                 r'(?:joint\s+)?(?:lead\s+)?(?:book[\-\s]?runner|manager|arranger|dealer|coordinator)s?',
@@ -93,7 +101,7 @@ class PatternRegistry:
                 r'Landesbank', r'Helaba', r'WestLB', r'Belfius',
                 r'Fortis', r'Mediobanca', r'BayernLB'
             ]
-        }
+        })
     
     @staticmethod
     def get_currency_patterns():
@@ -119,8 +127,8 @@ class PatternRegistry:
     
     @staticmethod
     def get_coupon_patterns():
-        """Get patterns for coupon rate extraction."""
-        return {
+        """Get patterns for coupon rate extraction (precompiled, case-insensitive)."""
+        return _compile_patterns({
             'coupon_rate': [
                 r'(?:interest\s+rate|coupon\s+rate|rate\s+of\s+interest|fixed\s+rate|coupon|interest)\s*[:\-]?\s*(?:of\s+)?(\d+(?:\.\d+)?)\s*(?:per\s*(?:cent\.?|%)|%)',
                 r'(\d+(?:\.\d+)?)\s*(?:per\s*(?:cent\.?|%)|%)(?:\s+(?:fixed\s+)?(?:rate\s+)?(?:interest|coupon))',
@@ -134,4 +142,4 @@ class PatternRegistry:
                 r'variable\s+rate', r'structured', r'range\s+accrual',
                 r'fixed\s+spread', r'discount', r'premium'
             ]
-        } 
\ No newline at end of file
+        }) 
\ No newline at end of file
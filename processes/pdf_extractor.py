@@ -29,6 +29,7 @@ Usage:
 """
 
 import os
+import re
 import concurrent.futures
 import logging
 from typing import Dict, List, Optional
@@ -36,6 +37,22 @@ from pathlib import Path
 
 from processes.pdf_extraction.core import ExtractionEngine
 
+# Filename terms that suggest a final terms document, matched in one pass
+_FINAL_TERMS_FILENAME_RE = re.compile(r'final|terms|pricing|supplement')
+
+# Per-process extractor for process_pdfs workers, built once by _init_worker
+_worker_extractor = None
+
+def _init_worker(extractor_cls: type, pdf_dir: str, use_ocr: bool):
+    """Create the extractor (and its logging and engine) once per worker process."""
+    global _worker_extractor
+    # The pool already spreads PDFs across processes, so each worker's engine runs single-threaded
+    _worker_extractor = extractor_cls(pdf_dir=pdf_dir, use_ocr=use_ocr, max_workers=1)
+
+def _process_pdf_in_worker(pdf_path: str) -> Optional[Dict]:
+    """Process one PDF with the worker's extractor, so process_single_pdf overrides apply."""
+    return _worker_extractor.process_single_pdf(pdf_path)
+
 class PDFExtractor:
     """
     PDF Document Extractor
@@ -92,9 +109,13 @@ class PDFExtractor:
         self.logger.info(f"Found {len(pdf_files)} PDF files")
             
         results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Text extraction and pattern matching are CPU-bound, so use processes rather than GIL-bound threads
+        # Each worker rebuilds an extractor of this class with the same settings
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers,
+                                                    initializer=_init_worker,
+                                                    initargs=(type(self), self.pdf_dir, self.use_ocr)) as executor:
             # Process PDFs in parallel
-            future_to_pdf = {executor.submit(self.process_single_pdf, str(pdf)): pdf for pdf in pdf_files}
+            future_to_pdf = {executor.submit(_process_pdf_in_worker, str(pdf)): pdf for pdf in pdf_files}
             
             for future in concurrent.futures.as_completed(future_to_pdf):
                 pdf = future_to_pdf[future]
@@ -133,8 +154,7 @@ class PDFExtractor:
         Returns:
             True if the filename suggests a final terms document
         """
-        filename_lower = filename.lower()
-        return any(term in filename_lower for term in ['final', 'terms', 'pricing', 'supplement'])
+        return _FINAL_TERMS_FILENAME_RE.search(filename.lower()) is not None
     
     def clean_bank_name(self, bank: str) -> str:
         """
@@ -0,0 +1,58 @@
+"""
+Shared Test Fixtures
+--------------------
+Builds ESMAScraper instances for unit tests without starting Chrome or touching the network.
+"""
+
+import sys
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add project root to sys.path to allow importing from processes
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+def _make_offline_scraper(download_dir=None):
+    """Return an ESMAScraper with the state __init__ sets up, minus the browser and HTTP session.
+
+    Keep this in step with ESMAScraper.__init__ when attributes are added there.
+    """
+    from processes.esma_scraper import ESMAScraper # Imported here so tests that don't need Selenium still collect
+
+    scraper = ESMAScraper.__new__(ESMAScraper)
+    scraper.logger = logging.getLogger("tests.esma_scraper")
+    scraper.base_dir = Path(download_dir) if download_dir else Path("data/downloads")
+    scraper.download_dir = scraper.base_dir
+    scraper._created_dirs = set()
+    scraper.document_hashes_file = scraper.base_dir / "document_hashes.json"
+    scraper.document_hashes = {}
+    scraper.current_company = None
+    scraper._today_str = datetime.now().strftime('%Y%m%d')
+    scraper.debug_mode = False
+    scraper.headless = True
+    scraper.company_list_handler = mock.Mock()
+    scraper.session_start_time = 0
+    scraper.requests_count = 0
+    scraper.max_session_duration = 3600
+    scraper.max_requests_per_session = 100
+    scraper.min_delay = 0
+    scraper.max_delay = 0
+    scraper._clean_streak = 0
+    scraper.default_wait_timeout = 1
+    scraper.max_download_workers = 4
+    scraper.http_session = mock.Mock()
+    scraper._download_lock = threading.Lock()
+    scraper.driver = None
+    scraper.wait = None
+    scraper.cookies_handled = False
+    return scraper
+
+@pytest.fixture
+def make_scraper():
+    """Factory fixture: call it to get a fresh offline ESMAScraper."""
+    return _make_offline_scraper
@@ -0,0 +1,30 @@
+from unittest import mock
+
+from processes.esma_scraper import retry_on_failure
+
+@retry_on_failure(max_retries=2, base_delay=0)
+def _step(scraper, result):
+    """Stand-in for a decorated scraper step that returns result."""
+    return result
+
+def test_successful_steps_grow_the_streak(make_scraper):
+    """Steps that succeed first time shorten the politeness delay"""
+    scraper = make_scraper()
+    _step(scraper, True)
+    _step(scraper, True)
+    assert scraper._clean_streak == 2
+
+def test_failed_step_resets_the_streak(make_scraper):
+    """A step that reports failure restores full delays"""
+    scraper = make_scraper()
+    scraper._clean_streak = 5
+    _step(scraper, False)
+    assert scraper._clean_streak == 0
+
+def test_streak_resets_for_each_company(make_scraper):
+    """search_and_process starts every company at full delays"""
+    scraper = make_scraper()
+    scraper._clean_streak = 12
+    scraper.navigate_to_search = mock.Mock(return_value=False)
+    scraper.search_and_process("TestCompany")
+    assert scraper._clean_streak == 0
@@ -0,0 +1,61 @@
+import sys
+import json
+from pathlib import Path
+
+# Add project root to sys.path to allow importing from processes
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from processes.company_list_handler import CompanyListHandler
+
+def _make_handler(tmp_path, downloaded=()):
+    """Build a handler backed by temporary tracking files, without reading the company Excel file."""
+    handler = CompanyListHandler.__new__(CompanyListHandler)
+    handler.downloaded_docs_file = tmp_path / "downloaded_documents.txt"
+    handler.company_stats_file = tmp_path / "company_stats.json"
+    handler.downloaded_docs = set(downloaded)
+    handler.company_stats = {}
+    handler.downloaded_docs_file.write_text(''.join(f"{doc_id}\n" for doc_id in downloaded))
+    return handler
+
+def test_mark_documents_bulk_appends_only_new_ids(tmp_path):
+    """Known and repeated IDs are skipped; new IDs are appended once, in input order"""
+    handler = _make_handler(tmp_path, downloaded=["a"])
+
+    new_ids = handler.mark_documents_as_downloaded_bulk(["b", "a", "c", "b"])
+
+    assert new_ids == ["b", "c"]
+    assert handler.downloaded_docs == {"a", "b", "c"}
+    assert handler.downloaded_docs_file.read_text().splitlines() == ["a", "b", "c"]
+
+def test_mark_documents_bulk_with_nothing_new_leaves_file_alone(tmp_path):
+    """A batch of already-known IDs writes nothing"""
+    handler = _make_handler(tmp_path, downloaded=["a"])
+
+    assert handler.mark_documents_as_downloaded_bulk(["a", "a"]) == []
+    assert handler.downloaded_docs_file.read_text().splitlines() == ["a"]
+
+def test_add_documents_bulk_counts_each_new_document_once(tmp_path):
+    """Stats count a document repeated within a batch only once"""
+    handler = _make_handler(tmp_path)
+
+    handler.add_downloaded_documents_bulk([
+        ("h1", "TestCompany", "Prospectus", "20240101"),
+        ("h1", "TestCompany", "Prospectus", "20240101"),
+        ("h2", "TestCompany", "Final Terms", "20240202"),
+    ])
+
+    stats = handler.company_stats["TestCompany"]
+    assert stats["total_documents"] == 2
+    assert stats["document_types"] == {"Prospectus": 1, "Final Terms": 1}
+    with open(handler.company_stats_file) as f:
+        assert json.load(f)["TestCompany"]["total_documents"] == 2
+
+def test_add_documents_bulk_skips_already_downloaded(tmp_path):
+    """Documents already in the downloaded set do not change the stats"""
+    handler = _make_handler(tmp_path, downloaded=["h1"])
+
+    handler.add_downloaded_documents_bulk([("h1", "TestCompany", "Prospectus", "20240101")])
+
+    assert handler.company_stats == {}
+    assert not handler.company_stats_file.exists()
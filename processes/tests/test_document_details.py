@@ -0,0 +1,42 @@
+import pytest
+
+def test_details_from_full_row(make_scraper):
+    """The first three cells and the link fill every field"""
+    details = make_scraper()._document_details_from_values(
+        ["TotalEnergies SE", "Final Terms", "01/02/2024", "extra"],
+        ["https://example.com/doc/123.pdf", "123.pdf", "Download"],
+    )
+    assert details == {
+        'issuer_name': "TotalEnergies SE",
+        'doc_type': "Final Terms",
+        'date': "01/02/2024",
+        'url': "https://example.com/doc/123.pdf",
+        'filename': "123.pdf",
+    }
+
+def test_details_fall_back_to_link_text_for_filename(make_scraper):
+    """Without a URL path segment the link text is used as the filename"""
+    details = make_scraper()._document_details_from_values(
+        ["Issuer", "Prospectus", "01/02/2024"],
+        ["https://example.com/", "", "Prospectus 2024"],
+    )
+    assert details['filename'] == "Prospectus 2024"
+
+def test_details_with_too_few_cells_keep_the_link(make_scraper):
+    """Short rows leave the cell fields empty but still return the link"""
+    details = make_scraper()._document_details_from_values(
+        ["Issuer"],
+        ["https://example.com/doc/1.pdf", "1.pdf", "Download"],
+    )
+    assert details['issuer_name'] == details['doc_type'] == details['date'] == ''
+    assert details['url'] == "https://example.com/doc/1.pdf"
+
+def test_details_without_link_have_no_url(make_scraper):
+    """Rows without a link come back without a URL, so callers skip them"""
+    details = make_scraper()._document_details_from_values(["Issuer", "Prospectus", "01/02/2024"], None)
+    assert details['url'] == '' and details['filename'] == ''
+
+def test_malformed_link_raises(make_scraper):
+    """A link that is not [href, filename, text] raises, for process_results to log and skip"""
+    with pytest.raises(ValueError):
+        make_scraper()._document_details_from_values(["Issuer", "Prospectus", "01/02/2024"], ["https://example.com"])
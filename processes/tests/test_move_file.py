@@ -0,0 +1,46 @@
+import errno
+from unittest import mock
+
+import pytest
+
+def test_move_file_renames_on_same_filesystem(make_scraper, tmp_path):
+    """A plain move lands the file at the destination and removes the source"""
+    source = tmp_path / "doc.pdf.part"
+    destination = tmp_path / "company" / "doc.pdf"
+    destination.parent.mkdir()
+    source.write_bytes(b"%PDF-1.4 test content")
+
+    make_scraper()._move_file(source, destination)
+
+    assert destination.read_bytes() == b"%PDF-1.4 test content"
+    assert not source.exists()
+
+def test_move_file_copies_across_filesystems(make_scraper, tmp_path):
+    """When rename fails with EXDEV the file is copied to the destination and the source removed"""
+    source = tmp_path / "doc.pdf.part"
+    destination = tmp_path / "company" / "doc.pdf"
+    destination.parent.mkdir()
+    content = b"%PDF-1.4 " + bytes(range(256)) * 8192 # Larger than one copy chunk
+    source.write_bytes(content)
+
+    exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+    with mock.patch("processes.esma_scraper.os.replace", side_effect=exdev) as replace:
+        make_scraper()._move_file(source, destination)
+
+    replace.assert_called_once_with(source, destination)
+    assert destination.read_bytes() == content
+    assert not source.exists()
+
+def test_move_file_reraises_other_errors(make_scraper, tmp_path):
+    """Errors other than EXDEV are not turned into a copy"""
+    source = tmp_path / "doc.pdf.part"
+    destination = tmp_path / "doc.pdf"
+    source.write_bytes(b"%PDF-1.4 test content")
+
+    denied = OSError(errno.EACCES, "Permission denied")
+    with mock.patch("processes.esma_scraper.os.replace", side_effect=denied):
+        with pytest.raises(OSError):
+            make_scraper()._move_file(source, destination)
+
+    assert source.exists()
+    assert not destination.exists()
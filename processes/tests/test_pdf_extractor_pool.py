@@ -0,0 +1,30 @@
+import sys
+import os
+from pathlib import Path
+
+# Add project root to sys.path to allow importing from processes
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from processes.pdf_extractor import PDFExtractor
+
+class RecordingExtractor(PDFExtractor):
+    """Extractor whose per-file work is overridden, to check that pool workers use it."""
+
+    def process_single_pdf(self, pdf_path: str):
+        return {'file': Path(pdf_path).name, 'pid': os.getpid(), 'max_workers': self.max_workers}
+
+def test_process_pdfs_returns_results_through_the_pool(tmp_path):
+    """process_pdfs runs the subclass's process_single_pdf in worker processes and collects every result"""
+    for name in ["a.pdf", "b.pdf", "nested/c.pdf"]:
+        pdf = tmp_path / name
+        pdf.parent.mkdir(parents=True, exist_ok=True)
+        pdf.write_bytes(b"%PDF-1.4\n")
+
+    extractor = RecordingExtractor(pdf_dir=str(tmp_path), use_ocr=False, max_workers=2)
+    results = extractor.process_pdfs()
+
+    assert sorted(result['file'] for result in results) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert all(result['pid'] != os.getpid() for result in results)
+    # Workers build their own single-threaded extractor
+    assert all(result['max_workers'] == 1 for result in results)
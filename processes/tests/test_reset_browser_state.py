@@ -0,0 +1,29 @@
+from unittest import mock
+
+def test_reset_clears_cookies_for_every_origin(make_scraper):
+    """The reset clears all browser cookies and the cache over CDP and re-arms the cookie banner check"""
+    scraper = make_scraper()
+    scraper.driver = mock.Mock()
+    scraper.cookies_handled = True
+    scraper.requests_count = 99
+
+    assert scraper.reset_browser_state() is True
+
+    scraper.driver.execute_cdp_cmd.assert_has_calls([
+        mock.call('Network.clearBrowserCookies', {}),
+        mock.call('Network.clearBrowserCache', {}),
+    ])
+    scraper.http_session.cookies.clear.assert_called_once()
+    assert scraper.cookies_handled is False
+    assert scraper.requests_count == 0
+
+def test_failed_reset_falls_back_to_restart(make_scraper):
+    """If CDP is unavailable the health check restarts Chrome instead"""
+    scraper = make_scraper()
+    scraper.driver = mock.Mock()
+    scraper.driver.execute_cdp_cmd.side_effect = RuntimeError("CDP unavailable")
+    scraper.requests_count = scraper.max_requests_per_session
+    scraper.refresh_session = mock.Mock()
+
+    assert scraper.check_session_health() is True
+    scraper.refresh_session.assert_called_once()
@@ -0,0 +1,70 @@
+import sys
+from unittest import mock
+
+import pytest
+
+from processes import main as pipeline
+
+@pytest.fixture
+def make_search_scraper(make_scraper):
+    """Offline scraper with the browser steps of search_and_process mocked out."""
+    def factory(search_ok=True, navigate_ok=True, documents=None):
+        scraper = make_scraper()
+        scraper.navigate_to_search = mock.Mock(return_value=navigate_ok)
+        scraper.search_company = mock.Mock(return_value=search_ok)
+        scraper.set_results_per_page = mock.Mock(return_value=True)
+        scraper.process_results = mock.Mock(return_value=documents or [])
+        scraper._sync_session_cookies = mock.Mock()
+        scraper.download_documents = mock.Mock(side_effect=lambda jobs: [f"/tmp/{doc_id}.pdf" for _, doc_id, _, _ in jobs])
+        scraper.company_list_handler.get_all_downloaded_ids.return_value = set()
+        scraper.company_list_handler.get_document_id.side_effect = lambda url, *args: f"id-{url}"
+        return scraper
+    return factory
+
+def test_failed_search_returns_none(make_search_scraper):
+    """A search that fails is reported as None, not as an empty result list"""
+    scraper = make_search_scraper(search_ok=False)
+    assert scraper.search_and_process("TestCompany") is None
+    scraper.process_results.assert_not_called()
+    scraper.company_list_handler.add_downloaded_documents_bulk.assert_not_called()
+
+def test_failed_navigation_returns_none(make_search_scraper):
+    """Failing to reach the search page is also reported as None"""
+    scraper = make_search_scraper(navigate_ok=False)
+    assert scraper.search_and_process("TestCompany") is None
+    scraper.search_company.assert_not_called()
+
+def test_search_without_documents_returns_empty_list(make_search_scraper):
+    """A successful search with no documents returns an empty list"""
+    scraper = make_search_scraper(documents=[])
+    assert scraper.search_and_process("TestCompany") == []
+
+def test_search_downloads_new_documents_only(make_search_scraper):
+    """Already-downloaded documents are skipped and new ones recorded in one bulk call"""
+    documents = [
+        {'url': 'https://example.com/a.pdf', 'doc_type': 'Prospectus', 'date': '20240101'},
+        {'url': 'https://example.com/b.pdf', 'doc_type': 'Final Terms', 'date': '20240202'},
+    ]
+    scraper = make_search_scraper(documents=documents)
+    scraper.company_list_handler.get_all_downloaded_ids.return_value = {'id-https://example.com/a.pdf'}
+
+    results = scraper.search_and_process("TestCompany")
+
+    assert [doc['url'] for doc in results] == ['https://example.com/b.pdf']
+    records = list(scraper.company_list_handler.add_downloaded_documents_bulk.call_args.args[0])
+    assert records == [('id-https://example.com/b.pdf', 'TestCompany', 'Final Terms', '20240202')]
+
+def test_main_does_not_mark_company_after_failed_search(make_search_scraper, tmp_path):
+    """main() leaves a company unprocessed when its search fails, so the next run retries it"""
+    handler = mock.Mock()
+    handler.get_unprocessed_companies.return_value = [{'name': 'TestCompany', 'country': 'France'}]
+    scraper = make_search_scraper(search_ok=False)
+
+    with mock.patch.object(pipeline, 'configure_logging'), \
+         mock.patch.object(pipeline, 'CompanyListHandler', return_value=handler), \
+         mock.patch.object(pipeline, 'ESMAScraper', return_value=scraper), \
+         mock.patch.object(sys, 'argv', ['main.py', '--output-dir', str(tmp_path)]):
+        pipeline.main()
+
+    handler.mark_company_as_processed.assert_not_called()
+    assert not list(tmp_path.glob('*.json'))